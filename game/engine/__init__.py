@@ -5,11 +5,11 @@ from .conf import conf
 
 __all__ = ('conf', 'init', 'quit')
 
-pg.mixer.pre_init(buffer = 1024)
-
 
 def init ():
     """Initialise the game engine."""
+    # must come before pg.init
+    pg.mixer.pre_init(buffer = 1024)
     pg.init()
     if conf.WINDOW_ICON is not None:
         pg.display.set_icon(pg.image.load(conf.WINDOW_ICON))
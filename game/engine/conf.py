@@ -2,7 +2,6 @@ import sys
 from platform import system
 import os
 from os.path import sep, expanduser, join as join_path
-from glob import glob
 
 import pygame as pg
 
@@ -13,18 +12,22 @@ from .util import dd
 def find_sounds (d):
     # find sounds in the given directory and group by base ID
     sounds = {}
-    fns = glob(join_path(d, '*.ogg'))
-    base = len(join_path(d, ''))
+    try:
+        fns = os.listdir(d)
+    except OSError:
+        # no sound directory
+        fns = []
+    # list names only rather than building full paths like glob does
     for fn in fns:
-        if os.path.isfile(fn):
-            fn = fn[base:-4]
-            for i in xrange(len(fn)):
-                if fn[i:].isdigit():
-                    # found a valid file
-                    ident = fn[:i]
-                    if ident:
-                        n = sounds.get(ident, 0)
-                        sounds[ident] = n + 1
+        # skip hidden files, as glob does
+        if not fn.endswith('.ogg') or fn[0] == '.':
+            continue
+        fn = fn[:-4]
+        # base ID is the name with the trailing number removed
+        ident = fn.rstrip('0123456789')
+        if ident and ident != fn:
+            # found a valid file
+            sounds[ident] = sounds.get(ident, 0) + 1
     return sounds
 
 
@@ -89,7 +92,7 @@ class Conf (object):
     FULLSCREEN = False
     RESIZABLE = False # also determines whether fullscreen togglable
     RES_W = (960, 540)
-    RES_F = None
+    RES_F = None # largest available display mode if None
     MIN_RES_W = (320, 180)
     ASPECT_RATIO = None
 
@@ -11,8 +11,13 @@ Entity()
 
 Currently, an entity is just a container of graphics.
 
+Entities define ``__slots__``, so subclasses that add attributes should list
+them in their own ``__slots__`` (or leave it out to get an instance dict).
+
 """
 
+    __slots__ = ('world', 'graphics')
+
     def __init__ (self):
         #: The :class:`World <engine.game.World>` this entity is in.  This is
         #: set by the world when the entity is added or removed.
@@ -30,5 +35,9 @@ This is called after :attr:`world` has been changed to the new world.
         pass
 
     def update (self):
-        """Called every frame to makes any necessary changes."""
+        """Called every frame to makes any necessary changes.
+
+The world only calls this for entities whose class overrides it.
+
+"""
         pass
@@ -169,8 +169,8 @@ Reference
 """
 
 import sys
+import re
 import shlex
-from StringIO import StringIO
 
 import pygame as pg
 
@@ -192,24 +192,111 @@ evts_by_name = dict(
         (issubclass(evt, evts.BaseEvent) and hasattr(evt, 'name')))
 )
 
+# match a word giving an input's device, with an optional scaling value for
+# relaxis events; groups are (scale, device)
+_match_device = re.compile(r'(?:([^*]*)\*)?({0})\Z'.format(
+    '|'.join(re.escape(device) for device in inputs_by_name)
+), re.S).match
+# {device: match}, where match matches a word giving an input's name with
+# optional input components; groups are (name, components)
+_name_matchers = dict((device, re.compile(r'({0})(?::(.*))?\Z'.format(
+    '|'.join(re.escape(name) for name in names)
+), re.S).match) for device, names in inputs_by_name.iteritems())
+
+# {name: mode} for button modes in evts.bmode
+_bmodes = dict((k, v) for k, v in vars(evts.bmode).iteritems()
+               if not k.startswith('_'))
+# keyword arguments to Button events given by trailing delays in an event
+# declaration, indexed by the number of delays
+_delay_args = (
+    (),
+    ('dbl_click_time',),
+    ('initial_delay', 'repeat_delay'),
+    ('dbl_click_time', 'initial_delay', 'repeat_delay')
+)
+# names of multi-modifiers in inputs.mod (which creates them on access)
+_mod_names = frozenset(k for k, v in vars(type(inputs.mod)).iteritems()
+                       if isinstance(v, property))
+# inputs that take a device ID
+_pad_inputs = frozenset((inputs.PadButton, inputs.PadAxis, inputs.PadHat))
+# inputs that take no arguments after an identifier
+_button_inputs = frozenset((inputs.KbdKey, inputs.MouseButton,
+                            inputs.PadButton))
+# inputs that take optional thresholds
+_axis_inputs = frozenset((inputs.PadAxis, inputs.PadHat, inputs.MouseAxis))
+# {cls: {name: identifier}} for inputs whose first argument is an identifier,
+# which may also be given as an integer
 _input_identifiers = {
-    inputs.KbdKey: lambda k: getattr(pg, 'K_' + k),
-    inputs.MouseButton: lambda k: getattr(inputs.mbtn, k),
-    inputs.PadButton: {}.__getitem__,
-    inputs.PadAxis: {}.__getitem__,
-    inputs.PadHat: {}.__getitem__
+    inputs.KbdKey: dict((k[2:], getattr(pg, k)) for k in dir(pg)
+                        if k.startswith('K_')),
+    inputs.MouseButton: dict((k, v) for k, v in vars(inputs.mbtn).iteritems()
+                             if not k.startswith('_')),
+    inputs.PadButton: {},
+    inputs.PadAxis: {},
+    inputs.PadHat: {}
 }
 
 
-def _parse_input (lnum, n_components, words, scalable, device = None,
-                  device_id = None):
-    # parse an input declaration line; words is non-empty; returns input
+# {config_string: lines} for strings passed to parse_s, where lines is as
+# returned by _split_lines
+_split_cache = {}
+# {(words, scalable): spec} for parsed input declarations, where spec is as
+# returned by _parse_input_spec
+_input_cache = {}
+
+
+def _parse_input (lnum, n_components, words, scalable, warnings):
+    # parse an input declaration line; words is non-empty; warnings is a list
+    # to add warning messages to; returns
+    # ([scale,] input, evt_components, input_components)
+    # the same lines tend to turn up repeatedly, so only parse each once
+    key = (tuple(words), scalable)
+    spec = _input_cache.get(key)
+    if spec is None:
+        spec = _parse_input_spec(lnum, n_components, words, scalable)
+        _input_cache[key] = spec
+    scale, i, evt_components, input_components = \
+        _mk_input(spec, lnum, warnings)
+    return ((() if scale is None else (scale,)) +
+            (i, evt_components, input_components))
+
+
+def _mk_input (spec, lnum, warnings):
+    # create an input from a spec returned by _parse_input_spec, adding its
+    # warnings to the given list; returns
+    # (scale, input, evt_components, input_components)
+    (spec_warnings, scale, cls, args, mods, evt_components,
+     input_components) = spec
+    for msg in spec_warnings:
+        warnings.append('warning: line {0}: {1}'.format(lnum, msg))
+    # inputs may alter list arguments (thresholds), so copy them
+    args = [list(arg) if isinstance(arg, list) else arg for arg in args]
+    for mod, ic in mods:
+        if isinstance(mod, basestring):
+            # multi-modifier
+            mod_i = getattr(inputs.mod, mod)
+        else:
+            mod_i = _mk_input(mod, lnum, warnings)[1]
+        args.append((mod_i, ic))
+    if evt_components is not None:
+        evt_components = list(evt_components)
+    if input_components is not None:
+        input_components = list(input_components)
+    return (scale, cls(*args), evt_components, input_components)
+
+
+def _parse_input_spec (lnum, n_components, words, scalable, device = None,
+                       device_id = None):
+    # parse an input declaration line; words is non-empty; returns
+    # (warnings, scale, cls, args, mods, evt_components, input_components),
+    # where mods is [(mod, input_component)], and each mod is the name of an
+    # attribute of inputs.mod or another spec
+    warnings = []
     # find the device
     device_i = None
     for i, w in enumerate(words):
-        if scalable and '*' in w:
-            w = w[w.find('*') + 1:]
-        if w in inputs_by_name:
+        m = _match_device(w)
+        if m is not None and (scalable or m.group(1) is None):
             device_i = i
             break
     if device_i is None:
@@ -218,22 +305,18 @@ def _parse_input (lnum, n_components, words, scalable, device = None,
                              'device'.format(lnum))
         # else device was given, so may omit it
         pre_dev = []
+        scale_s = None
     else:
-        device = words[device_i]
+        scale_s, device = m.groups()
         pre_dev = words[:device_i]
         words = words[device_i + 1:]
     # parse relaxis scale
     scale = None
-    if scalable and '*' in device:
-        i = device.find('*')
-        scale_s = device[:i]
-        device = device[i + 1:]
-        if i:
-            try:
-                scale = float(scale_s)
-            except ValueError:
-                raise ValueError('line {0}: invalid scaling value'
-                                 .format(lnum))
+    if scale_s:
+        try:
+            scale = float(scale_s)
+        except ValueError:
+            raise ValueError('line {0}: invalid scaling value'.format(lnum))
     # everything before device and before the first '[' is a component
     for w_i, w in enumerate(pre_dev):
         if w.startswith('['):
@@ -273,36 +356,32 @@ def _parse_input (lnum, n_components, words, scalable, device = None,
 
     # find the name
     names = inputs_by_name[device]
+    match_name = _name_matchers[device]
     name_i = None
     for i, w in enumerate(words):
-        if ':' in w:
-            w = w[:w.find(':')]
-        if w in names:
+        m = match_name(w)
+        if m is not None:
             name_i = i
             break
     input_components = None
     if name_i is None:
         name = None
     else:
-        name = words[name_i]
+        name, ics_s = m.groups()
         # parse input components
-        if ':' in name:
-            i = name.find(':')
-            ics_s = name[i + 1:]
-            name = name[:i]
-            if ics_s:
-                # comma-separated ints
-                try:
-                    # int() handles whitespace fine
-                    input_components = [int(ic) for ic in ics_s.split(',')]
-                except ValueError:
-                    raise ValueError('line {0}: invalid input components'
-                                     .format(lnum))
+        if ics_s:
+            # comma-separated ints
+            try:
+                # int() handles whitespace fine
+                input_components = [int(ic) for ic in ics_s.split(',')]
+            except ValueError:
+                raise ValueError('line {0}: invalid input components'
+                                 .format(lnum))
     if not name:
         # name empty or entire argument omitted
         if len(names) == 1:
             # but there's only one choice
-            name = names.keys()[0]
+            name = next(iter(names))
         else:
             raise ValueError('line {0}: input declaration contains no name'
                              .format(lnum))
@@ -312,12 +391,11 @@ def _parse_input (lnum, n_components, words, scalable, device = None,
         device_id = True
     elif name_i == 1:
         if device_id is not None:
-            print >> sys.stderr, 'warning: got device ID for modifier; ' \
-                                 'ignoring'
+            warnings.append('got device ID for modifier; ignoring')
         else:
-            if cls not in (inputs.PadButton, inputs.PadAxis, inputs.PadHat):
-                print >> sys.stderr, 'warning: got device ID for input ' \
-                                     'that doesn\'t support it; ignoring'
+            if cls not in _pad_inputs:
+                warnings.append('got device ID for input that doesn\'t '
+                                'support it; ignoring')
             device_id = words[0]
             if device_id and device_id[0] == '<' and device_id[-1] == '>':
                 device_id = device_id[1:-1]
@@ -330,76 +408,72 @@ def _parse_input (lnum, n_components, words, scalable, device = None,
     else:
         raise ValueError('line {0}: too many arguments between device and name'
                          .format(lnum))
-    if name_i is not None:
-        words = words[name_i + 1:]
-
-    # now just arguments remain
-    if cls in (inputs.PadButton, inputs.PadAxis, inputs.PadHat):
+    # now just arguments remain, from words[arg_i] on
+    arg_i = 0 if name_i is None else name_i + 1
+    n_words = len(words)
+    if cls in _pad_inputs:
         args = [device_id]
     else:
         args = []
     if cls in _input_identifiers:
         # first is an identifier
-        src = _input_identifiers[cls]
-        if not words:
+        if arg_i == n_words:
             raise ValueError('line {0}: too few arguments'.format(lnum))
-        try:
-            ident = src(words[0])
-        except (AttributeError, KeyError):
+        ident = _input_identifiers[cls].get(words[arg_i])
+        if ident is None:
             try:
-                ident = int(words[0])
+                ident = int(words[arg_i])
             except ValueError:
                 raise ValueError('line {0}: invalid {1} code'
                                  .format(lnum, name))
         args.append(ident)
-        words = words[1:]
-    if cls in (inputs.KbdKey, inputs.MouseButton, inputs.PadButton):
+        arg_i += 1
+    if cls in _button_inputs:
         # no more args
-        if words:
+        if arg_i < n_words:
             raise ValueError('line {0}: too many arguments'.format(lnum))
-    elif cls in (inputs.PadAxis, inputs.PadHat, inputs.MouseAxis):
+    elif cls in _axis_inputs:
         if cls is inputs.MouseAxis:
             # next arg is optional boundary
-            if words:
+            if arg_i < n_words:
                 try:
-                    bdy = float(words[0])
+                    bdy = float(words[arg_i])
                 except ValueError:
                     raise ValueError('line {0}: invalid \'boundary\' argument'
                                      .format(lnum))
-                words = words[1:]
+                arg_i += 1
             else:
                 bdy = None
             args.append(bdy)
         # next args are optional thresholds
-        thresholds = []
-        if words:
-            # let the input check values/numbers of components
-            for w in words:
-                try:
-                    thresholds.append(float(w))
-                except ValueError:
-                    raise ValueError('line {0}: invalid \'threshold\' argument'
-                                     .format(lnum))
+        # let the input check values/numbers of components
+        try:
+            thresholds = map(float, words[arg_i:])
+        except ValueError:
+            raise ValueError('line {0}: invalid \'threshold\' argument'
+                             .format(lnum))
         if not thresholds:
             thresholds = None
         args.append(thresholds)
 
-    # parse modifiers and add to args
+    # parse modifiers
+    mods = []
     mod_num = 1
     for mod_words in all_mod_words:
-        if len(mod_words) == 1 and hasattr(inputs.mod, mod_words[0]):
+        if len(mod_words) == 1 and mod_words[0] in _mod_names:
             # got a multi-modifier
-            mod_i = getattr(inputs.mod, mod_words[0])
+            mod = mod_words[0]
             mod_ics = (0,)
         else:
             # parse the mod's words like any other input
-            mod_i, mod_ecs, mod_ics = _parse_input(
+            mod = _parse_input_spec(
                 '{0}[mod {1}]'.format(lnum, mod_num), 1, mod_words, False,
                 device, device_id
             )
+            mod_cls, mod_ecs, mod_ics = mod[2], mod[5], mod[6]
             mod_num += 1
             if (mod_ecs not in (None, (0,)) or
-                (mod_ics is None and mod_i.components > 1) or
+                (mod_ics is None and mod_cls.components > 1) or
                 (mod_ics is not None and len(mod_ics) > 1)):
                 raise ValueError('line {0}: modifier cannot use more '
                                  'than one component'.format(lnum))
@@ -407,10 +481,10 @@ def _parse_input (lnum, n_components, words, scalable, device = None,
                 # mod_i has 1 component, so use that
                 mod_ics = (0,)
         # now mod_ics is a length-1 sequence (can never be length-0)
-        args.append((mod_i, mod_ics[0]))
+        mods.append((mod, mod_ics[0]))
 
-    return ((() if scale is None else (scale,)) +
-            (cls(*args), evt_components, input_components))
+    return (warnings, scale, cls, args, mods, evt_components,
+            input_components)
 
 
 def _parse_evthead (lnum, words):
@@ -436,28 +510,23 @@ def _parse_evthead (lnum, words):
         # args are modes, last few may be repeat/double-click delays
         delays = []
         for i in xrange(len(words)):
-            if hasattr(evts.bmode, words[i]):
-                args.append(getattr(evts.bmode, words[i]))
+            if words[i] in _bmodes:
+                args.append(_bmodes[words[i]])
             else:
                 # check for float
                 if i < len(words) - 3:
                     raise ValueError('line {0}: invalid event arguments'
                                      .format(lnum))
                 # got one: do the last part of the loop
-                for w in words[i:]:
-                    try:
-                        delays.append(float(w))
-                    except ValueError:
-                        raise ValueError('line {0}: invalid event arguments'
-                                         .format(lnum))
+                try:
+                    delays = map(float, words[i:])
+                except ValueError:
+                    raise ValueError('line {0}: invalid event arguments'
+                                     .format(lnum))
                 break
         # work out which delay is which
-        kwargs.update(dict(zip([
-            (),
-            ('dbl_click_time',),
-            ('initial_delay', 'repeat_delay'),
-            ('dbl_click_time', 'initial_delay', 'repeat_delay'),
-        ][len(delays)], delays)))
+        for k, delay in zip(_delay_args[len(delays)], delays):
+            kwargs[k] = delay
     else:
         raise ValueError('line {0}: unknown event type \'{1}\''
                          .format(lnum, evt_type))
@@ -469,42 +538,81 @@ def parse (config):
 
 parse(config) -> parsed
 
-:arg config: an open file-like object (with a ``readline`` method).
+:arg config: an open file-like object (with a ``read`` method).
 
 :return: ``{name: event}`` for each named
          :class:`BaseEvent <engine.evt.evts.BaseEvent>` instance.
 
 """
+    return _parse_lines(_split_lines(config.read()))
+
+
+# lines containing these need shlex's quoting and escaping rules
+_needs_shlex = re.compile(r'[\'"\\]').search
+# words are separated by the same whitespace as in shlex
+_find_words = re.compile(r'[^ \t\r\n]+').findall
+# lines are as given by readline, keeping line endings
+_find_lines = re.compile(r'.*\n|.+').findall
+
+
+def _split_line (line):
+    # split a line into words with shell-like syntax; shlex is slow (it works a
+    # character at a time in Python), and most lines don't use quoting, so use
+    # a regular expression where possible
+    if _needs_shlex(line):
+        return shlex.split(line, True)
+    else:
+        # '#' starts a comment anywhere outside of quotes
+        return _find_words(line.partition('#')[0])
+
+
+def _split_lines (config):
+    # split a configuration string into words, giving [(lnum, words)] for each
+    # non-blank line
+    lines = []
+    for lnum, line in enumerate(_find_lines(config), 1):
+        words = _split_line(line)
+        if words:
+            lines.append((lnum, words))
+        # else blank line
+    return lines
+
+
+def _parse_lines (lines):
+    # parse the result of _split_lines
+    # show warnings all at once when done
+    warnings = []
+    try:
+        return _parse_events(lines, warnings)
+    finally:
+        if warnings:
+            sys.stderr.write('\n'.join(warnings) + '\n')
+
+
+def _parse_events (lines, warnings):
+    # parse the result of _split_lines, adding warning messages to the given
+    # list
     parsed = {} # events
     evt_cls = None
-    lnum = 1
-    while True:
-        line = config.readline()
-        if not line:
-            # end of file
-            break
-        words = shlex.split(line, True)
-        if words:
-            if words[0] in evts_by_name:
-                # new event: create and add current event
-                if evt_cls is not None:
-                    parsed[evt_name] = evt_cls(*args, **kwargs)
-                evt_cls, evt_name, args, kwargs = _parse_evthead(lnum, words)
-                if evt_name in parsed:
-                    raise ValueError('line {0}: duplicate event name: \'{1}\''
-                                     .format(lnum, evt_name))
-                scalable = evt_cls.name in ('relaxis', 'relaxis2')
+    for lnum, words in lines:
+        if words[0] in evts_by_name:
+            # new event: create and add current event
+            if evt_cls is not None:
+                parsed[evt_name] = evt_cls(*args, **kwargs)
+            evt_cls, evt_name, args, kwargs = _parse_evthead(lnum, words)
+            if evt_name in parsed:
+                raise ValueError('line {0}: duplicate event name: \'{1}\''
+                                 .format(lnum, evt_name))
+            scalable = evt_cls.name in ('relaxis', 'relaxis2')
+            if issubclass(evt_cls, evts.MultiEvent):
+                n_cs = evt_cls.multiple * evt_cls.child.components
             else:
-                if evt_cls is None:
-                    raise ValueError('line {0}: expected event'.format(lnum))
-                # input line
-                if issubclass(evt_cls, evts.MultiEvent):
-                    n_cs = evt_cls.multiple * evt_cls.child.components
-                else:
-                    n_cs = evt_cls.components
-                args.append(_parse_input(lnum, n_cs, words, scalable))
-        # else blank line
-        lnum += 1
+                n_cs = evt_cls.components
+        else:
+            if evt_cls is None:
+                raise ValueError('line {0}: expected event'.format(lnum))
+            # input line
+            args.append(_parse_input(lnum, n_cs, words, scalable, warnings))
     if evt_cls is not None:
         parsed[evt_name] = evt_cls(*args, **kwargs)
     return parsed
@@ -521,4 +629,10 @@ parse(config) -> parsed
          :class:`BaseEvent <engine.evt.evts.BaseEvent>` instance.
 
 """
-    return parse(StringIO(config))
+    # the same strings tend to get loaded repeatedly (eg. conf.GAME_EVENTS for
+    # every world), so only split them once; events and inputs are created
+    # anew each time, since they can't be shared between handlers
+    lines = _split_cache.get(config)
+    if lines is None:
+        lines = _split_cache[config] = _split_lines(config)
+    return _parse_lines(lines)
@@ -24,6 +24,26 @@ evt_component_names = {
     2: ('neg', 'pos'),
     4: ('left', 'right', 'up', 'down')
 }
+# {n_components: {component_name: index}}, from evt_component_names
+_component_indices = dict(
+    (n, dict((name, i) for i, name in enumerate(names)))
+    for n, names in evt_component_names.iteritems()
+)
+
+
+def _component_signs (i, evt_components, input_components):
+    # [(sign, input_component)] for an input's components registered with a
+    # 2-component axis event, where sign is the direction the component moves
+    # the axis in
+    if i.provides['axis'] or i.provides['relaxis']:
+        return [(2 * ec - 1, ic)
+                for ec, ic in zip(evt_components, input_components)]
+    else: # i.provides['button']
+        # only used components count when held (input_components is the
+        # input's used_components for the event)
+        return [(2 * evt_components[c] - 1, input_components[c])
+                for c in input_components
+                if input_components[c] in input_components]
 
 
 class BaseEvent (object):
@@ -34,6 +54,10 @@ either :meth:`Event.gen_cb_args` or :meth:`respond`.
 
 """
 
+    # the handler also sets _changed, _domain and _regname
+    __slots__ = ('eh', 'cbs', '_wrapped_cbs', '_changed', '_domain',
+                 '_regname')
+
     #: Like :attr:`Input.components <engine.evt.inputs.Input.components>`---the
     #: number of components the event can handle.
     components = 0
@@ -45,6 +69,8 @@ either :meth:`Event.gen_cb_args` or :meth:`respond`.
         #: dict whose keys are functions to call on input.
         # values are wrappers to call
         self.cbs = {}
+        # values of cbs, updated when it changes
+        self._wrapped_cbs = ()
 
     def _parse_input (self, i):
         # normalise the form of an input as taken by Event.add
@@ -71,16 +97,11 @@ either :meth:`Event.gen_cb_args` or :meth:`respond`.
         if isinstance(input_components, int):
             input_components = (input_components,)
         evt_components = []
-        c_by_name = None
         for ec in orig_evt_components:
             # translate from name
             if isinstance(ec, basestring):
-                if c_by_name is None:
-                    c_by_name = dict((v, i)
-                        for i, v in enumerate(evt_component_names[components])
-                    )
                 try:
-                    ec = c_by_name[ec]
+                    ec = _component_indices[components][ec]
                 except KeyError:
                     raise ValueError('unknown component name: \'{0}\''
                                         .format(ec))
@@ -109,6 +130,7 @@ arguments, it is not passed any.
         all_cbs = self.cbs
         for cb in cbs:
             all_cbs[cb] = wrap_fn(cb)
+        self._wrapped_cbs = tuple(all_cbs.itervalues())
         return self
 
     def rm_cbs (self, *cbs):
@@ -123,6 +145,7 @@ Missing items are ignored.
         for cb in cbs:
             if cb in all_cbs:
                 del all_cbs[cb]
+        self._wrapped_cbs = tuple(all_cbs.itervalues())
         return self
 
     def respond (self, changed):
@@ -135,7 +158,7 @@ Called by the containing
 called every time the handler is updated (which should happen every frame).
 
 """
-        cbs = self.cbs.values()
+        cbs = self._wrapped_cbs
         for args in self.gen_cb_args(changed):
             for cb in cbs:
                 cb(*args)
@@ -173,6 +196,8 @@ once for each event gathered by the inputs.
 
 """
 
+    __slots__ = ('inputs',)
+
     def __init__ (self, *inps):
         BaseEvent.__init__(self)
         #: ``{input: (evt_components, input_components)}`` (see :meth:`add`).
@@ -258,7 +283,12 @@ pass to each callback.  Guaranteed to be called whenever
                 # call once for each Pygame event stored
                 for pgevt in i._pgevts:
                     yield (pgevt,)
-                i.reset()
+            if self.eh is None:
+                for i in self.inputs:
+                    i.reset()
+            else:
+                # shared inputs get reset once, after all events have seen them
+                self.eh._reset_inputs.update(self.inputs)
 
 
 class MultiEvent (BaseEvent):
@@ -277,6 +307,8 @@ possibly wrapping it.
 
 """
 
+    __slots__ = ('components', 'evts', '_eh')
+
     def __init__ (self, inps, *args, **kw):
         self.components = self.multiple * self.child.components
         #: A list of sub-events, in order of the components they map to.
@@ -325,7 +357,8 @@ possibly wrapping it.
             current_evt_i = 0
             i_added = False
             for ec, ic in mixed_cs:
-                evt_i = ec // cs_per_evt
+                # event index and component within that event
+                evt_i, ec = divmod(ec, cs_per_evt)
                 if evt_i != current_evt_i:
                     # moving on to a new event
                     if ecs:
@@ -333,7 +366,7 @@ possibly wrapping it.
                         ecs = []
                         ics = []
                     current_evt_i = evt_i
-                ecs.append(ec % cs_per_evt)
+                ecs.append(ec)
                 ics.append(ic)
             if ecs:
                 arglists[current_evt_i].append(i + (ecs, ics))
@@ -396,6 +429,9 @@ events are registered within a frame.
 
 """
 
+    __slots__ = ('modes', '_downevts', '_upevts', 'initial_delay',
+                 'repeat_delay', 'dbl_click_time', '_repeating',
+                 '_can_dbl_click', '_repeat_remain', '_dbl_click_remain')
     name = 'button'
     components = 1
 
@@ -499,7 +535,7 @@ events are registered within a frame.
             if not self._can_dbl_click:
                 # handled the first down event
                 downevts -= 1
-            self._can_dbl_click = can = not (downevts % 2)
+            self._can_dbl_click = can = not (downevts & 1)
             if got:
                 # got some presses
                 if can:
@@ -507,7 +543,7 @@ events are registered within a frame.
                     self._dbl_click_remain = self.dbl_click_time
                 if downevts > 0:
                     # got some second presses within the required time
-                    n_dbls = (downevts + 1) / 2
+                    n_dbls = (downevts + 1) >> 1
             elif can:
                 # reduce time left to click again
                 self._dbl_click_remain -= self.eh.scheduler.frame
@@ -529,6 +565,7 @@ this applies to (``0`` or ``1``) and ``evts`` is the argument passed by
 
 """
 
+    __slots__ = ()
     name = 'button2'
     child = Button
     multiple = 2
@@ -557,6 +594,7 @@ as being (left, up, right, down).  ``axis`` corresponds to the x or y axis
 
 """
 
+    __slots__ = ()
     name = 'button4'
     multiple = 4
 
@@ -578,13 +616,31 @@ over each registered input and restricting to ``-1 <= x <= 1``).
 
 """
 
+    __slots__ = ('_input_signs', '_pos')
     name = 'axis'
     components = 2
 
     def __init__ (self, *inps):
+        # {input: component_signs}, as given by _component_signs
+        self._input_signs = {}
         Event.__init__(self, *inps)
         self._pos = 0
 
+    def add (self, *inps):
+        """:inherit:"""
+        new_inputs = Event.add(self, *inps)
+        signs = self._input_signs
+        for i in new_inputs:
+            signs[i] = _component_signs(i, *self.inputs[i])
+        return new_inputs
+
+    def rm (self, *inps):
+        """:inherit:"""
+        Event.rm(self, *inps)
+        signs = self._input_signs
+        for i in inps:
+            signs.pop(i, None)
+
     def input_valid (self, i):
         """:inherit:"""
         return i.provides['axis'] or i.provides['button']
@@ -594,22 +650,18 @@ over each registered input and restricting to ``-1 <= x <= 1``).
         if changed:
             # compute position: sum over every input
             pos = 0
-            for i, (evt_components, input_components) \
-                in self.inputs.iteritems():
+            for i, signs in self._input_signs.iteritems():
                 if i.provides['axis']:
                     # add current axis position for each component
-                    for ec, ic in zip(evt_components, input_components):
-                        pos += (2 * ec - 1) * i._pos[ic]
+                    for sign, ic in signs:
+                        pos += sign * i._pos[ic]
                 else: # i.provides['button']
-                    used_components = i.used_components[self]
                     # add 1 for each held component
-                    for j, held in enumerate(i.held(self)):
-                        c = used_components[j]
-                        ic = input_components[c]
-                        if ic in used_components and i._held[ic]:
-                            pos += 2 * evt_components[c] - 1
+                    for sign, ic in signs:
+                        if i._held[ic]:
+                            pos += sign
             # clamp to [-1, 1]
-            self._pos = pos = min(1, max(-1, pos))
+            self._pos = pos = 1 if pos > 1 else (-1 if pos < -1 else pos)
         else:
             # use previous position
             pos = self._pos
@@ -623,6 +675,7 @@ Callbacks are called every frame with a list of axis positions for each of the
 two axes.
 
 """
+    __slots__ = ()
     name = 'axis2'
     child = Axis
     multiple = 2
@@ -650,12 +703,15 @@ Callbacks are called with the total, scaled relative change over all inputs
 registered with this event.
 
 """
+    __slots__ = ('input_scales', '_input_signs')
     name = 'relaxis'
     components = 2
 
     def __init__ (self, *inps):
         #: ``{scale: input}`` (see :meth:`add`).
         self.input_scales = {}
+        # {input: component_signs}, as given by _component_signs
+        self._input_signs = {}
         Event.__init__(self, *inps)
 
     def add (self, *inps):
@@ -679,15 +735,21 @@ calling callbacks.
                 raise ValueError("input scaling must be non-negative.")
             scale[i[1]] = i[0]
             real_inputs.append(i[1:])
-        return Event.add(self, *real_inputs)
+        new_inputs = Event.add(self, *real_inputs)
+        signs = self._input_signs
+        for i in new_inputs:
+            signs[i] = _component_signs(i, *self.inputs[i])
+        return new_inputs
 
     def rm (self, *inps):
         """:inherit:"""
         Event.rm(self, *inps)
         # remove stored scales (no KeyError means all inputs exist)
         scale = self.input_scales
+        signs = self._input_signs
         for i in inps:
             del scale[i]
+            del signs[i]
 
     def input_valid (self, i):
         """:inherit:"""
@@ -698,26 +760,24 @@ calling callbacks.
         """:inherit:"""
         rel = 0
         scale = self.input_scales
+        signs = self._input_signs
         # sum all relative positions
         for i, (evt_components, input_components) \
             in self.inputs.iteritems():
             this_rel = 0
             if i.provides['relaxis']:
-                for ec, ic in zip(evt_components, input_components):
-                    this_rel += (2 * ec - 1) * i.rel[ic]
+                for sign, ic in signs[i]:
+                    this_rel += sign * i.rel[ic]
                 i.reset(*input_components)
             elif i.provides['axis']:
                 # use axis position
-                for ec, ic in zip(evt_components, input_components):
-                    this_rel += (2 * ec - 1) * i._pos[ic]
+                for sign, ic in signs[i]:
+                    this_rel += sign * i._pos[ic]
             else: # i.provides['button']
-                used_components = i.used_components[self]
                 # use 1 for each held component
-                for j, held in enumerate(i.held(self)):
-                    c = used_components[j]
-                    ic = input_components[c]
-                    if ic in used_components and i._held[ic]:
-                        this_rel += 2 * evt_components[c] - 1
+                for sign, ic in signs[i]:
+                    if i._held[ic]:
+                        this_rel += sign
             rel += this_rel * scale[i]
         if rel:
             yield (rel,)
@@ -730,6 +790,7 @@ Callbacks are called every frame with a list of positions for each of the two
 relative axes.
 
 """
+    __slots__ = ()
     name = 'relaxis2'
     child = RelAxis
     multiple = 2
@@ -8,24 +8,32 @@ from .evts import BaseEvent, Event
 from . import conffile
 
 
-def _check_mods (i, mods):
-    # check if input's required modifiers are active
+def _relevant_mods (i, mods):
+    # get (mod, required) for each registered modifier that affects the input
     this_mods = i.mods
+    rtn = []
     for device in inputs.mod_devices[i.device]:
         for device_id in set((i.device_id, True)):
             for m in mods.get(device, {}).get(device_id, ()):
-                # mod matches if it's the same button
-                # as the input itself
-                if m == i:
-                    yield True
-                    continue
-                # or if it's held in exactly this
-                # input's components
-                if m in this_mods:
-                    # only have one component
-                    yield m.held(i)[0] and m._held.count(True) == 1
-                else:
-                    yield not any(m._held)
+                # mod always matches if it's the same button as the input
+                # itself
+                if not m == i:
+                    rtn.append((m, m in this_mods))
+    return tuple(rtn)
+
+
+def _check_mods (i, mods):
+    # check if input's required modifiers are active, given the result of
+    # _relevant_mods
+    for m, required in mods:
+        # mod matches if it's held in exactly this input's components
+        if required:
+            # only have one component
+            if not (m.held(i)[0] and m._held.count(True) == 1):
+                return False
+        elif any(m._held):
+            return False
+    return True
 
 
 class EventHandler (object):
@@ -60,6 +68,9 @@ Some notes:
         #: :meth:`disable`.
         self.inactive_domains = set()
         self._evts_by_domain = {}
+        # event lists from _evts_by_domain to respond, in order, or None if
+        # domains have changed since this was built
+        self._dispatch = None
         #: A ``set`` of all registered unnamed events.
         self.evts = set()
         # {name: event} for named events; wrapped by this class like a dict
@@ -72,6 +83,11 @@ Some notes:
         self._init_data = set()
         # all registered modifiers
         self._mods = {}
+        # {input: _relevant_mods(input, self._mods)}, filled in as required
+        self._mod_cache = {}
+        # inputs whose stored Pygame events have been passed on to callbacks;
+        # reset once every event has responded
+        self._reset_inputs = set()
         #: Whether to capture the mouse cursor by centring it on the window
         #: every frame.  You might also want to grab all input
         #: (``pygame.event.set_grab``).
@@ -137,6 +153,7 @@ will register callbacks ``f1`` and ``f2`` for keydown events, and ``f3`` and
             by_domain[domain] = []
             if domain is not None:
                 self.active_domains.add(domain)
+            self._dispatch = None
         for evts in (((None, evt) for evt in evts), named_evts.iteritems()):
             for name, evt in evts:
                 if not isinstance(evt, BaseEvent): # NOTE: also Scheme
@@ -156,6 +173,7 @@ will register callbacks ``f1`` and ``f2`` for keydown events, and ``f3`` and
                             by_domain[prev_domain].remove(evt)
                             if not by_domain[prev_domain]:
                                 del by_domain[prev_domain]
+                                self._dispatch = None
                             evt._domain = domain
                             by_domain[domain].append(evt)
                         prev_name = evt._regname
@@ -214,6 +232,7 @@ Raises ``KeyError`` if any arguments are missing.
                         active.remove(domain)
                     else:
                         inactive.remove(domain)
+                    self._dispatch = None
                 evt._domain = None
                 if evt._regname is None:
                     unnamed.remove(evt)
@@ -310,6 +329,7 @@ of callback functions.  For example::
                             # already added as an input
                         else:
                             this_mods[m] = set((i,))
+                            self._mod_cache.clear()
                             if not added:
                                 added = True
                                 self._add_inputs(m)
@@ -333,6 +353,7 @@ of callback functions.  For example::
                         d3.remove(i)
                         if not d3:
                             del d2[m]
+                            self._mod_cache.clear()
                             if not rmd:
                                 rmd = True
                                 self._rm_inputs(m)
@@ -341,13 +362,25 @@ of callback functions.  For example::
                                 if not d1:
                                     del mods[m.device]
             self.inputs.remove(i)
+            # might be readded with a different device ID
+            self._mod_cache.pop(i, None)
             self._unprefilter(self._filtered_inputs, i.filters, i)
 
-    def update (self):
-        """Process Pygame events and call callbacks."""
+    def update (self, pgevts=None):
+        """Process Pygame events and call callbacks.
+
+update([pgevts])
+
+:arg pgevts: a sequence of ``pygame.event.Event`` instances to process.  If not
+             given, the Pygame event queue is drained.
+
+"""
         all_inputs = self._filtered_inputs
         mods = self._mods
-        pgevts = pg.event.get()
+        mod_cache = self._mod_cache
+        ButtonInput = inputs.ButtonInput
+        if pgevts is None:
+            pgevts = pg.event.get()
         # centre mouse
         if self.autocentre_mouse:
             sfc = pg.display.get_surface()
@@ -359,7 +392,7 @@ of callback functions.  For example::
         for pgevt in pgevts:
             # find matching inputs
             sources = [all_inputs]
-            inps = []
+            inps = set()
             while sources:
                 source = sources.pop()
                 if isinstance(source, tuple):
@@ -370,18 +403,20 @@ of callback functions.  For example::
                             sources.append(filtered[val])
                     sources.append(filtered[inputs.UNFILTERABLE])
                 else:
-                    inps.append(source)
-            inps = set().union(*inps)
+                    inps.update(source)
             # check all modifiers are active
             for i in inps:
                 args = ()
-                if isinstance(i, inputs.ButtonInput):
+                if isinstance(i, ButtonInput):
                     is_mod = i.is_mod
                     if is_mod:
                         # mods have no mods, so always match
                         args = (True,)
                     else:
-                        args = (all(_check_mods(i, mods)),)
+                        i_mods = mod_cache.get(i)
+                        if i_mods is None:
+                            i_mods = mod_cache[i] = _relevant_mods(i, mods)
+                        args = (_check_mods(i, i_mods),)
                 else:
                     is_mod = False
                 # careful: mods have no event
@@ -390,14 +425,22 @@ of callback functions.  For example::
                         evt._changed = True
 
         # call callbacks
-        by_domain = self._evts_by_domain
-        for domains in ((None,), self.active_domains):
-            for domain in domains:
-                if domain is not None or domain in by_domain:
-                    for evt in by_domain[domain]:
-                        changed = evt._changed
-                        evt._changed = False
-                        evt.respond(changed)
+        dispatch = self._dispatch
+        if dispatch is None:
+            by_domain = self._evts_by_domain
+            dispatch = [by_domain[domain] for domain in self.active_domains]
+            if None in by_domain:
+                dispatch.insert(0, by_domain[None])
+            self._dispatch = dispatch
+        for evts in dispatch:
+            for evt in evts:
+                changed = evt._changed
+                evt._changed = False
+                evt.respond(changed)
+        reset = self._reset_inputs
+        for i in reset:
+            i.reset()
+        reset.clear()
 
     def domains (self, *domains):
         """Get all events in the given domains.
@@ -491,6 +534,7 @@ empty).
             if domain in active:
                 active.remove(domain)
                 inactive.add(domain)
+                self._dispatch = None
 
     def enable (self, *domains):
         """Re-enable event handling in all of the given domains.
@@ -507,6 +551,7 @@ much time has passed, without sending a
             if domain in inactive:
                 inactive.remove(domain)
                 active.add(domain)
+                self._dispatch = None
 
     def assign_devices (self, **devices):
         """Assign device IDs to inputs by device variable.
@@ -576,33 +621,23 @@ events.
         for ident, dz in deadzones:
             if isinstance(ident, basestring):
                 # just got a device
-                ident = [ident]
+                ident = (ident,)
             else:
-                ident = list(ident)
-            if len(ident) == 0:
+                ident = tuple(ident)
+            if not ident:
                 raise ValueError('invalid input identifier: empty sequence')
-            if len(ident) == 1:
-                # accept any device ID
-                ident.append(True)
-            if len(ident) == 2:
-                # no more constraints
-                ident.append({})
-            device, dev_id, attrs = ident
+            # by default, accept any device ID and have no more constraints
+            device, dev_id, attrs = ident + (True, {})[len(ident) - 1:]
             got_var = isinstance(dev_id, basestring)
 
             for i in self.inputs:
+                if i.device != device or not hasattr(i, 'deadzone'):
+                    continue
                 if got_var:
                     match_dev_id = i.device_var == dev_id
                 else:
                     match_dev_id = (i.device_id is not None and
                                     (dev_id is True or i.device_id == dev_id))
-                if i.device == device and match_dev_id:
-                    if all(getattr(i, attr) == val
-                           for attr, val in attrs.iteritems()):
-                        try:
-                            getattr(i, 'deadzone')
-                        except AttributeError:
-                            # doesn't have a deadzone
-                            pass
-                        else:
-                            i.deadzone = dz
+                if match_dev_id and all(getattr(i, attr) == val
+                                        for attr, val in attrs.iteritems()):
+                    i.deadzone = dz
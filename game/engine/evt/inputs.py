@@ -313,7 +313,9 @@ BasicInput(*pgevts)
     def reset (self):
         """Clear cached Pygame events.
 
-Called by the owning :class:`Event <engine.evt.evts.Event>`.
+Called by the owning :class:`Event <engine.evt.evts.Event>`, or by its
+:class:`EventHandler <engine.evt.handler.EventHandler>` once every event has
+responded.
 
 """
         self._pgevts = []
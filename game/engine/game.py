@@ -8,7 +8,7 @@ instance for changing worlds and handling the display.
 
 import sys
 import os
-from random import choice, randrange
+from random import shuffle, randrange
 from math import exp
 
 import pygame as pg
@@ -18,6 +18,7 @@ from .conf import conf
 from .sched import Scheduler
 from . import evt, gfx, res, text
 from .util import ir, convert_sfc
+from .entity import Entity
 
 
 def run (*args, **kwargs):
@@ -35,6 +36,10 @@ argument ``t`` to run for this many seconds.
         Game(*args, **kwargs).run(t)
 
 
+# to check whether entities override it (a plain function in Python 2 and 3)
+_entity_update = Entity.__dict__['update']
+
+
 class _ClassProperty (property):
     """Decorator to create a static property."""
 
@@ -88,12 +93,18 @@ World(scheduler, evthandler, resources)
         #: ``set`` of :class:`Entity <engine.entity.Entity>` instances in this
         #: world.
         self.entities = set()
+        # entities that override Entity.update, so need updating every frame
+        self._updating_entities = set()
 
         self._initialised = False
         self._extra_args = (args, kwargs)
         self._music_evt = self.evthandler.add((conf.EVENT_ENDMUSIC,))[0]
         # {sound_id: [(sound, vol)]}, vol excluding the world's sound volume
         self._sounds = {}
+        # {filename: [sound]} for copies of sounds that aren't playing
+        self._idle_snds = {}
+        # {sound: filename} for all copies of sounds we've made
+        self._snd_fns = {}
         self._avg_draw_time = scheduler.frame
         self._since_last_draw = 0
 
@@ -101,10 +112,15 @@ World(scheduler, evthandler, resources)
     @classmethod
     def id (cls):
         # doc is in the class(!)
-        if hasattr(cls, '_id'):
-            return cls._id
-        else:
-            return cls.__name__.lower()
+        # cached per class---look in __dict__ so subclasses don't inherit it
+        ident = cls.__dict__.get('_cached_id')
+        if ident is None:
+            if hasattr(cls, '_id'):
+                ident = cls._id
+            else:
+                ident = cls.__name__.lower()
+            cls._cached_id = ident
+        return ident
 
     @property
     def fps (self):
@@ -163,7 +179,7 @@ This receives the extra arguments passed in constructing the world through the
 
     def _update (self):
         """Called by the game to update."""
-        for e in list(self.entities):
+        for e in list(self._updating_entities):
             e.update()
         self.update()
 
@@ -245,6 +261,8 @@ Each entity passed may also be a sequence of entities to add.
                     e.graphics.manager = self.graphics
                 # else manager was explicitly set, so don't change it
                 all_entities.add(e)
+                if getattr(e.update, '__func__', None) is not _entity_update:
+                    self._updating_entities.add(e)
                 e.world = self
                 e.added()
 
@@ -264,6 +282,7 @@ Each entity passed may also be a sequence of entities to remove.
             else:
                 if e in all_entities:
                     all_entities.remove(e)
+                    self._updating_entities.discard(e)
                 e.world = None
                 # unset gm even if it's not this world's main manager
                 e.graphics.manager = None
@@ -342,7 +361,8 @@ play_music([group], loop=True[, cb])
            sequentially until the active world changes, music from a different
            group is played, or the Pygame mixer is manually stopped.  If a
            number, play that many randomly selected tracks (if falsy, do
-           nothing).
+           nothing).  Tracks are shuffled, so every track in the group is
+           played before any is repeated.
 :arg cb: a function to call when all the music has been played, according to
          the value of ``loop``.  Called even if no music is played (if there is
          none in this group, or ``loop`` is falsy).
@@ -372,8 +392,22 @@ Raises ``KeyError`` if the given group does not exist.
             elif cb is not None:
                 cb()
 
+        # tracks left to play, in (reversed) order
+        order = []
+
         def play_next ():
-            pg.mixer.music.load(choice(fns))
+            game = conf.GAME
+            if not order:
+                order.extend(fns)
+                shuffle(order)
+                # don't play the same track twice in a row between shuffles
+                if len(order) > 1 and order[-1] == game._music_fn:
+                    order[0], order[-1] = order[-1], order[0]
+            fn = order.pop()
+            # the track stays loaded after it finishes, so don't reload it
+            if fn != game._music_fn:
+                pg.mixer.music.load(fn)
+                game._music_fn = fn
             pg.mixer.music.play()
 
         play_next()
@@ -400,25 +434,23 @@ play_snd(base_id, volume=1)
             ident = randrange(conf.SOUNDS[base_id])
             base_id += str(ident)
         # else not a random sound
-        # load sound, and make a copy so we can play/stop instances separately
-        # (without managing channels, at least)
-        snd = self.resources.snd(base_id + '.ogg')
-        snd = pg.mixer.Sound(snd.get_buffer()
-                             if hasattr(snd, 'get_buffer') else snd.get_raw())
-        # store sound, and stop oldest if necessary
         playing = self._sounds.setdefault(alias, [])
+        i = 0
+        while i < len(playing):
+            if playing[i][0].get_num_channels() == 0:
+                # sound is no longer playing, so remove it
+                self._release_snd(playing.pop(i)[0])
+            else:
+                i += 1
+        # stop oldest if necessary
         if alias in conf.MAX_SOUNDS:
             assert len(playing) <= conf.MAX_SOUNDS[alias]
             if len(playing) == conf.MAX_SOUNDS[alias] and playing:
-                playing.pop(0)[0].stop()
-        else:
-            i = 0
-            while i < len(playing):
-                if playing[i][0].get_num_channels() == 0:
-                    # sound is no longer playing, so remove it
-                    playing.pop(i)
-                else:
-                    i += 1
+                snd = playing.pop(0)[0]
+                snd.stop()
+                self._release_snd(snd)
+        # store sound
+        snd = self._get_snd_copy(base_id + '.ogg')
         playing.append((snd, volume))
         # play
         volume *= conf.SOUND_VOLUME[self.id]
@@ -428,6 +460,23 @@ play_snd(base_id, volume=1)
         snd.set_volume(volume)
         snd.play()
 
+    def _get_snd_copy (self, fn):
+        # get a copy of a sound so we can play/stop instances separately
+        # (without managing channels, at least), reusing one that isn't
+        # playing if possible
+        idle = self._idle_snds.get(fn)
+        if idle:
+            return idle.pop()
+        snd = self.resources.snd(fn)
+        snd = pg.mixer.Sound(snd.get_buffer()
+                             if hasattr(snd, 'get_buffer') else snd.get_raw())
+        self._snd_fns[snd] = fn
+        return snd
+
+    def _release_snd (self, snd):
+        # make a sound returned by _get_snd_copy available for reuse
+        self._idle_snds.setdefault(self._snd_fns[snd], []).append(snd)
+
     def _get_base_ids (self, *base_ids, **kwargs):
         # takes (*base_ids, exclude=False) to get the base_ids this represents
         if not base_ids:
@@ -446,6 +495,7 @@ play_snd(base_id, volume=1)
             s = c.get_sound()
             if s is not None:
                 snds[s] = c
+        return snds
 
     def _with_channels (self, method, *base_ids, **kwargs):
         # call a method on matching sounds' channels
@@ -503,6 +553,7 @@ stop_snds(*base_ids, exclude=False)
         ):
             for snd, vol in all_snds.pop(base_id, ()):
                 snd.stop()
+                self._release_snd(snd)
 
     def scale_volume (self, vol):
         """Called to scale audio volumes before using them.
@@ -530,9 +581,16 @@ Takes the same arguments as :meth:`create_world` and passes them to it.
 
 """
 
+    # attributes are read every frame, and there's only one instance anyway
+    __slots__ = ('_quit', '_update_again', 'world', 'worlds', 'screen',
+                 'resources', '_using_pool', 'text_renderers',
+                 '_world_text_renderers', '_music_fn')
+
     def __init__ (self, *args, **kwargs):
         conf.GAME = self
-        conf.RES_F = pg.display.list_modes()[0]
+        # only query display modes if the game didn't set a resolution
+        if conf.RES_F is None:
+            conf.RES_F = pg.display.list_modes()[0]
         self._quit = False
         self._update_again = False
         #: The currently running world.
@@ -553,10 +611,14 @@ Takes the same arguments as :meth:`create_world` and passes them to it.
         #: :class:`text.TextRenderer <engine.text.TextRenderer>` instances
         #: available for referral by name in the ``'text'`` resource loader.
         self.text_renderers = {}
+        # {world_id: {name: renderer}}, built from conf.TEXT_RENDERERS
+        self._world_text_renderers = {}
 
         self._init_cbs()
         # set up music
         pg.mixer.music.set_endevent(conf.EVENT_ENDMUSIC)
+        # filename of the track currently loaded by World.play_music
+        self._music_fn = None
         # start first world
         self.start_world(*args, **kwargs)
 
@@ -578,6 +640,8 @@ Takes the same arguments as :meth:`create_world` and passes them to it.
                 self.refresh_display()
 
         conf.on_change('RES_F', change_res_f, source=self)
+        conf.on_change('TEXT_RENDERERS',
+                       lambda: self._world_text_renderers.clear(), source=self)
 
     def _change_resource_pool (self, new_pool):
         # callback: after conf.DEFAULT_RESOURCE_POOL change
@@ -631,13 +695,20 @@ should be passed to that base class).
         self.world = world
         world.display.orig_sfc = self.screen
         world.display.dirty()
-        # create text renderers required by this world
-        for name, r in conf.TEXT_RENDERERS[world.id].iteritems():
-            if not isinstance(r, text.TextRenderer):
-                if isinstance(r, basestring):
-                    r = (r,)
-                r = text.TextRenderer(*r)
-            self.text_renderers[name] = r
+        # create text renderers required by this world, only the first time a
+        # world of this type is selected
+        ident = world.id
+        renderers = self._world_text_renderers.get(ident)
+        if renderers is None:
+            renderers = {}
+            for name, r in conf.TEXT_RENDERERS[ident].iteritems():
+                if not isinstance(r, text.TextRenderer):
+                    if isinstance(r, basestring):
+                        r = (r,)
+                    r = text.TextRenderer(*r)
+                renderers[name] = r
+            self._world_text_renderers[ident] = renderers
+        self.text_renderers.update(renderers)
         world._select()
 
     def start_world (self, *args, **kwargs):
@@ -678,12 +749,9 @@ get_worlds(ident, current = True) -> worlds
 :return: the world list, in order of time started, most recent last.
 
 """
-        worlds = []
-        current = [{'world': self.world}] if current else []
-        for data in self.worlds + current:
-            world = data['world']
-            if world.id == ident:
-                worlds.append(world)
+        worlds = [w for w in self.worlds if w.id == ident]
+        if current and self.world.id == ident:
+            worlds.append(self.world)
         return worlds
 
     def quit_world (self, depth = 1):
@@ -698,15 +766,17 @@ quit_world(depth = 1) -> worlds
 If this quits the last (root) world, exit the game.
 
 """
-        if depth < 1:
-            return []
-        old_world = self.world
-        old_world.quit()
-        if self.worlds:
-            self._select_world(self.worlds.pop())
-        else:
-            self.quit()
-        return [old_world] + self.quit_world(depth - 1)
+        quit = []
+        while depth >= 1:
+            old_world = self.world
+            old_world.quit()
+            quit.append(old_world)
+            if self.worlds:
+                self._select_world(self.worlds.pop())
+            else:
+                self.quit()
+            depth -= 1
+        return quit
 
     # display
 
@@ -754,27 +824,43 @@ If this quits the last (root) world, exit the game.
 
     def _resize_cb (self, event):
         """Callback to handle a window resize."""
+        # the display is refreshed by the settings callback for RES_W
         conf.RES_W = (event.w, event.h)
-        self.refresh_display()
 
     def _update (self):
         """Update worlds and draw."""
+        # drain the event queue in one go; a world selected during this frame
+        # gets its events from the next frame's batch
+        pgevts = pg.event.get()
         self._update_again = True
         while self._update_again:
             self._update_again = False
-            self.world.evthandler.update()
+            # the world may change in any of these calls
+            world = self.world
+            world.evthandler.update(pgevts)
+            pgevts = ()
             # if a new world was created during the above call, we'll end up
             # updating twice before drawing
             if not self._update_again:
-                self.world._update()
-        if self.world._handle_slowdown():
-            drawn = self.world.draw()
+                world._update()
+        world = self.world
+        if world._handle_slowdown():
+            drawn = world.draw()
             # update display
             if drawn is True:
                 update_display()
             elif drawn:
-                if len(drawn) > 60: # empirical - faster to update everything
+                n = len(drawn)
+                if n > 60: # empirical - faster to update everything
                     update_display()
+                elif n > 8:
+                    # if the rects overlap a lot, it's cheaper to update their
+                    # bounding rect once
+                    bound = pg.Rect(drawn[0]).unionall(drawn[1:])
+                    if bound.w * bound.h <= sum(r[2] * r[3] for r in drawn):
+                        update_display(bound)
+                    else:
+                        update_display(drawn)
                 else:
                     update_display(drawn)
         return True
@@ -55,6 +55,8 @@ These can be set to apply to all contained graphics.
     #: :class:`Graphic <engine.gfx.graphic.Graphic>` attributes.
     graphic_attrs = ('layer', 'visible', 'blit_flags', 'anchor', 'rot_anchor',
                      'scale_fn', 'rotate_fn', 'rotate_threshold')
+    # for membership tests on every attribute set
+    _graphic_attrs_set = frozenset(graphic_attrs)
 
     def __init__ (self, x=0, y=0):
         self._pos = [x, y]
@@ -84,7 +86,7 @@ These can be set to apply to all contained graphics.
         self.rm(graphic)
 
     def __setattr__ (self, attr, val):
-        if attr in self.graphic_attrs:
+        if attr in self._graphic_attrs_set:
             for g in self:
                 setattr(g, attr, val)
         else:
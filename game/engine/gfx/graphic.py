@@ -412,7 +412,8 @@ Defaults to ``'center'``.
         """Function to use for scaling.
 
 Defaults to ``pygame.transform.smoothscale`` (and should have the same
-signature as this default).
+signature as this default).  For graphics that are scaled by whole numbers,
+:func:`gfx.util.integer_scale <engine.gfx.util.integer_scale>` is much faster.
 
 """
         return self._scale_fn
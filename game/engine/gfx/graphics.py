@@ -108,13 +108,11 @@ Colour(colour, rect, layer=0)
             else:
                 # same as last time
                 return (dest, False)
-        # create new surface and fill
+        # create new surface (already in the display format) and fill
         new_sfc = pg.Surface(src.get_size())
         if colour[3] < 255:
             # non-opaque: need to convert to alpha
             new_sfc = new_sfc.convert_alpha()
-        else:
-            new_sfc = new_sfc.convert()
         new_sfc.fill(colour)
         return (new_sfc, True)
 
@@ -915,9 +913,10 @@ Grid(grid, gap_colour='aaa', bg_colour='0000', pos=(0, 0), layer=0)
                   layer=0):
         gap_colour = gameutil.normalise_colour(gap_colour)
         bg_colour = gameutil.normalise_colour(bg_colour)
+        # new surfaces are already in the display format
         sfc = pg.Surface(grid.size)
-        sfc = (sfc.convert_alpha() if gap_colour[3] < 255 or bg_colour[3] < 255
-                                   else sfc.convert())
+        if gap_colour[3] < 255 or bg_colour[3] < 255:
+            sfc = sfc.convert_alpha()
         # fill with gaps and add in tiles
         sfc.fill(gap_colour)
         if bg_colour != gap_colour:
@@ -6,6 +6,26 @@ from ..conf import conf
 from .. import util
 
 
+def integer_scale (sfc, size):
+    """Scale a surface, using a fast nearest-neighbour scale where possible.
+
+integer_scale(sfc, size) -> new_sfc
+
+This has the same signature as ``pygame.transform.smoothscale``, and is suitable
+for use as :attr:`Graphic.scale_fn <engine.gfx.graphic.Graphic.scale_fn>`.  If
+each dimension of ``size`` is an integer multiple of the surface's size,
+``pygame.transform.scale`` is used, which is much faster and keeps pixel edges
+sharp; otherwise, ``pygame.transform.smoothscale`` is used.
+
+"""
+    w, h = size
+    sfc_w, sfc_h = sfc.get_size()
+    if sfc_w and sfc_h and w % sfc_w == 0 and h % sfc_h == 0:
+        return pg.transform.scale(sfc, (w, h))
+    else:
+        return pg.transform.smoothscale(sfc, (w, h))
+
+
 class Spritemap (object):
     """A wrapper for spritesheets.
 
@@ -6,6 +6,10 @@ from .conf import conf
 from .util import convert_sfc, normalise_colour
 
 
+# marks a cache miss, since a cached resource might be None
+_missing = object()
+
+
 def _identity_keys (arg):
     yield arg
 
@@ -170,14 +174,17 @@ This is equivalent to
         # retrieve from cache, or load and store in cache
         load, mk_keys, measure = self._loaders[loader]
         ks = set(mk_keys(*args, **kw))
-        if force_load or not ks & set(cache.iterkeys()):
-            resource = load(*args, **kw)
-            # only cache if the pool has users
-            if users:
-                for k in ks:
-                    cache[k] = resource
-        else:
-            resource = cache[ks.pop()]
+        if not force_load:
+            # look up our keys rather than intersecting with every cached key
+            for k in ks:
+                resource = cache.get(k, _missing)
+                if resource is not _missing:
+                    return resource
+        resource = load(*args, **kw)
+        # only cache if the pool has users
+        if users:
+            for k in ks:
+                cache[k] = resource
         return resource
 
     def register (self, name, load, mk_keys, measure=_unit_measure):
@@ -76,26 +76,32 @@ interp_linear(*waypoints) -> f
             vs.append(w)
             ts.append(None)
     ts[0] = 0
-    # get groups with time = None
-    groups = []
-    group = None
-    for i, (v, t) in enumerate(zip(vs, ts)):
-        if t is None:
-            if group is None:
-                group = [i]
-                groups.append(group)
-        else:
-            if group is not None:
-                group.append(i)
-            group = None
-    # and assign times within those groups
-    for i0, i1 in groups:
-        t0 = ts[i0 - 1]
-        dt = float(ts[i1] - t0) / (i1 - (i0 - 1))
-        for i in xrange(i0, i1):
-            ts[i] = t0 + dt * (i - (i0 - 1))
-    interp_val = lambda r, v1, v2, v0: (r * (v2 - v1) + v1) \
-                                       if isinstance(v2, (int, float)) else v0
+    # assign times to runs of waypoints without them, evenly spaced between
+    # the surrounding waypoints, in a single pass
+    prev = 0
+    for i in xrange(1, len(ts)):
+        if ts[i] is not None:
+            n = i - prev
+            if n > 1:
+                t0 = ts[prev]
+                dt = float(ts[i] - t0) / n
+                ts[prev + 1:i] = [t0 + dt * j for j in xrange(1, n)]
+            prev = i
+    # precompute everything that doesn't depend on t: for each segment, the
+    # starting values and the differences to the next waypoint (None where we
+    # don't vary the value), and the reciprocal of the segment's duration
+    start_val = lambda v1, v2, v0: v1 if isinstance(v2, (int, float)) else v0
+    diff_val = lambda v1, v2: (v2 - v1) if isinstance(v2, (int, float)) \
+                              else None
+    segs = [(ts[i - 1],
+             None if ts[i] == ts[i - 1] else 1. / (ts[i] - ts[i - 1]),
+             call_in_nest(start_val, vs[i - 1], vs[i], vs[0]),
+             call_in_nest(diff_val, vs[i - 1], vs[i]))
+            for i in xrange(1, len(ts))]
+    end_val = call_in_nest(lambda vl, v0: vl if isinstance(vl, (int, float))
+                                             else v0, vs[-1], vs[0])
+    interp_val = lambda r, v1, dv: v1 if dv is None else (r * dv + v1)
+    n_ts = len(ts)
 
     def val_gen ():
         t = yield
@@ -105,20 +111,15 @@ interp_linear(*waypoints) -> f
             if i == 0:
                 # before start
                 t = yield vs[0]
-            elif i == len(ts):
+            elif i == n_ts:
                 # past end: use final value, then end
-                last_val = lambda vl, v0: vl if isinstance(vl, (int, float)) \
-                                             else v0
-                t = yield call_in_nest(last_val, vs[-1], vs[0])
+                t = yield end_val
                 yield None
             else:
-                v1 = vs[i - 1]
-                v2 = vs[i]
-                t1 = ts[i - 1]
-                t2 = ts[i]
+                t1, t_scale, v1, dv = segs[i - 1]
                 # get ratio of the way between waypoints
-                r = 1 if t2 == t1 else (t - t1) / (t2 - t1) # t is always float
-                t = yield call_in_nest(interp_val, r, v1, v2, vs[0])
+                r = 1 if t_scale is None else (t - t1) * t_scale
+                t = yield call_in_nest(interp_val, r, v1, dv)
 
     # start the generator; get_val is its send method
     g = val_gen()
@@ -569,9 +570,12 @@ it does not necessarily reflect real time.
                 t_left = min(seconds, t_left)
             elif frames is not None:
                 t_left = min(frames * frame, t_left)
-            # wait
+            # wait; pygame.time.wait sleeps rather than spinning, and we skip
+            # the call entirely if it would sleep for less than a millisecond
             if t_left > 0:
-                wait(int(1000 * t_left))
+                wait_ms = int(1000 * t_left)
+                if wait_ms:
+                    wait(wait_ms)
                 t_gone += t_left
                 frame_t += r * t_left
             # update some attributes
@@ -61,9 +61,13 @@ set it to a value (or use :meth:`add`).  Note that a setting may not begin with
 
 """
         if isinstance(settings, type):
-            settings = dict((k, v) for k, v in settings.__dict__.iteritems()
-                                   if not k.startswith('_'))
-        for k, v in settings.iteritems():
+            # skip private attributes (including __module__, __doc__, etc.)
+            # without building an intermediate dict
+            items = ((k, v) for k, v in settings.__dict__.iteritems()
+                            if k[0] != '_')
+        else:
+            items = settings.iteritems()
+        for k, v in items:
             if not filter_caps or k.isupper():
                 if k.startswith('_'):
                     raise ValueError('invalid setting name: \'{0}\''.format(k))
@@ -31,9 +31,10 @@ dd(default[, items], **kwargs) -> default_dict
 :return: the created ``defaultdict``.
 
 """
-    items = items.copy()
-    items.update(kwargs)
-    return defaultdict(lambda: default, items)
+    # defaultdict copies items, so we can add kwargs to the result directly
+    d = defaultdict(lambda: default, items)
+    d.update(kwargs)
+    return d
 
 
 def takes_args (func):
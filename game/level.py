@@ -18,6 +18,8 @@ def get_win_frame (root, win):
 
 
 class Ball (Entity):
+    __slots__ = ('graphic', 'vel')
+
     def __init__ (self, pos, vel):
         Entity.__init__(self)
         self.graphics.pos = pos
@@ -48,17 +50,16 @@ class Ball (Entity):
 
 
 class Rects (Entity):
+    __slots__ = ('rects',)
+
     def __init__ (self, c, rects):
         Entity.__init__(self)
-        for r in rects:
-            r = pg.Rect(r)
+        # these never move, so build them once for collision checks
+        self.rects = tuple(pg.Rect(r) for r in rects)
+        for r in self.rects:
             self.graphics.add(gfx.Colour(c, r.size, conf.LAYERS['rect']),
                               *r.topleft)
 
-    @property
-    def rects (self):
-        return [g.rect for g in self.graphics]
-
 
 def update_display ():
     conf.GAME.refresh_display()
@@ -77,6 +78,8 @@ class Level (World):
         self.goals = [gfx.Colour(
             conf.GOAL_COLOUR, (pos, conf.GOAL_SIZE), conf.LAYERS['goal']
         ) for pos in data['goals']]
+        # goals never move, so keep their rects for collision checks
+        self.goal_rects = [g.rect for g in self.goals]
         self.balls = [Ball(pos, vel) for pos, vel in data['balls']]
         if len(self.goals) != len(self.balls):
             print 'warning: {} goals, {} balls'.format(len(self.goals),
@@ -157,8 +160,7 @@ class Level (World):
 
         for b in bs:
             rect = b.rect
-            expel = tuple(self.platforms.rects)
-            orig_expel = tuple(expel)
+            expel = orig_expel = self.platforms.rects
             expel_types = [None] * len(expel)
             b_data = [(this_b, this_b.rect)
                         for this_b in bs if this_b is not b]
@@ -286,9 +288,10 @@ class Level (World):
             self.update_physics(old_rect)
             # remove touched goals and balls
             for b in self.balls:
-                col = b.rect.collidelistall([g.rect for g in self.goals])
-                if col:
-                    self.graphics.rm(self.goals.pop(col.pop(0)))
+                col = b.rect.collidelist(self.goal_rects)
+                if col != -1:
+                    del self.goal_rects[col]
+                    self.graphics.rm(self.goals.pop(col))
                     self.balls.remove(b)
                     self.rm(b)
                     self.play_snd('goal')